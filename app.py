@@ -1,67 +1,146 @@
-from flask import Flask, render_template, request, jsonify
+import base64
+import hashlib
+from datetime import date
+import orjson
+from flask import Flask, render_template, request, jsonify, g
+from flask.json.provider import JSONProvider
 import database
 
+
+def _orjson_default(obj):
+    """Serialize types orjson doesn't handle natively."""
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    # Namedtuple rows from database.py are sent as objects
+    if hasattr(obj, "_asdict"):
+        return obj._asdict()
+    raise TypeError
+
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson for faster jsonify() on large row lists."""
+    
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS)
+        return self._app.response_class(body, mimetype="application/json")
+
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+
+# Keyset pagination for list endpoints
+PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
 
 # Initialize database on startup
 database.init_db()
 
 
+@app.teardown_appcontext
+def release_db_connection(exception=None):
+    """Return the request thread's database connection to the pool."""
+    database.release_connection()
+
+
+@app.before_request
+def set_today():
+    """Compute today's date once so every query in a request sees the same day."""
+    g.today = date.today().isoformat()
+
+
+def encode_cursor(key: tuple) -> str:
+    """Encode the sort key of the last row on a page as an opaque cursor."""
+    return base64.urlsafe_b64encode(orjson.dumps(list(key))).decode()
+
+
+def decode_cursor(cursor: str) -> tuple:
+    """Decode a cursor from encode_cursor. Raises ValueError if it is malformed."""
+    key = orjson.loads(base64.urlsafe_b64decode(cursor.encode()))
+    if not isinstance(key, list) or len(key) != 2 or not all(v is None or isinstance(v, str) for v in key):
+        raise ValueError("Invalid cursor")
+    return tuple(key)
+
+
+def get_page_args() -> tuple:
+    """Read (limit, after) from the limit and cursor query params."""
+    limit = request.args.get("limit", PAGE_SIZE, type=int)
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    cursor = request.args.get("cursor")
+    after = decode_cursor(cursor) if cursor else None
+    return limit, after
+
+
+def with_snapshot(payload: dict, selected_date: str) -> dict:
+    """Add the date's calls and contacts to a mutation response if the client asked for them."""
+    if request.headers.get("X-Return-Snapshot") == "1":
+        payload["calls"] = database.get_today_calls(selected_date)
+        payload["contacts"] = database.get_contacts_for_date(selected_date)
+    return payload
+
+
+# Encouraging messages, built once and shared across requests
+_SUCCESS_RESPONSES = frozenset(("A", "B", "C"))
+_MESSAGES = {
+    "rampage": {
+        "text": "You're on Rampage, let's get it done!",
+        "type": "rampage",
+        "emoji": "⚡🔥"
+    },
+    "done": {
+        "text": "Target achieved! Keep the momentum going!",
+        "type": "success",
+        "emoji": "🎉🏆"
+    },
+    "NA": {
+        "text": "Call this guy next time, let's go for next!",
+        "type": "followup",
+        "emoji": "🔥"
+    },
+    "CATCHUP": {
+        "text": "Nice catchup! Building relationships matters!",
+        "type": "catchup",
+        "emoji": "💝"
+    },
+    "DNP": {
+        "text": "Someone's waiting for your call. Let's reach till there!",
+        "type": "retry",
+        "emoji": "🔥🔥"
+    }
+}
+
+
 def get_encouraging_message(response: str, successful_count: int, target: int) -> dict:
     """Generate an encouraging message based on response type and progress."""
-    remaining = target - successful_count
-    
-    # Check if on rampage (one away from target) - only for successful responses
-    if response in ("A", "B", "C") and remaining == 1:
-        return {
-            "text": "You're on Rampage, let's get it done!",
-            "type": "rampage",
-            "emoji": "⚡🔥"
-        }
-    
-    if response in ("A", "B", "C"):
+    if response in _SUCCESS_RESPONSES:
+        remaining = target - successful_count
+        # One away from target is a rampage
+        if remaining == 1:
+            return _MESSAGES["rampage"]
         if remaining <= 0:
-            return {
-                "text": "Target achieved! Keep the momentum going!",
-                "type": "success",
-                "emoji": "🎉🏆"
-            }
+            return _MESSAGES["done"]
         return {
             "text": f"Great, {remaining} to go!",
             "type": "success",
             "emoji": "🎉"
         }
-    elif response == "NA":
-        return {
-            "text": "Call this guy next time, let's go for next!",
-            "type": "followup",
-            "emoji": "🔥"
-        }
-    elif response == "CATCHUP":
-        return {
-            "text": "Nice catchup! Building relationships matters!",
-            "type": "catchup",
-            "emoji": "💝"
-        }
-    else:  # DNP
-        return {
-            "text": "Someone's waiting for your call. Let's reach till there!",
-            "type": "retry",
-            "emoji": "🔥🔥"
-        }
+    return _MESSAGES.get(response, _MESSAGES["DNP"])
 
 
 @app.route("/")
 def dashboard():
     """Render the main dashboard."""
     # Get selected date from query param, default to today
-    selected_date = request.args.get("date", database.get_today())
-    today = database.get_today()
+    selected_date = request.args.get("date", g.today)
+    today = g.today
     
-    target = database.get_daily_target(selected_date)
-    stats = database.get_today_stats(selected_date)
-    calls = database.get_today_calls(selected_date)
-    contacts = database.get_contacts_for_date(selected_date)
+    target, stats, calls, contacts = database.get_dashboard_snapshot(selected_date)
     
     return render_template(
         "index.html",
@@ -80,13 +159,13 @@ def set_target():
     """Set the daily target."""
     data = request.get_json()
     target = int(data.get("target", 0))
-    selected_date = data.get("date", database.get_today())
+    selected_date = data.get("date", g.today)
     
     if target < 1:
         return jsonify({"error": "Target must be at least 1"}), 400
     
-    database.set_daily_target(target, selected_date)
-    return jsonify({"success": True, "target": target})
+    stats = database.set_daily_target(target, selected_date, return_stats=True)
+    return jsonify({"success": True, "target": target, "stats": stats})
 
 
 @app.route("/add-call", methods=["POST"])
@@ -95,7 +174,7 @@ def add_call():
     data = request.get_json()
     name = data.get("name", "").strip()
     response = data.get("response", "").upper()
-    selected_date = data.get("date", database.get_today())
+    selected_date = data.get("date", g.today)
     
     if not name:
         return jsonify({"error": "Name is required"}), 400
@@ -103,29 +182,25 @@ def add_call():
     if response not in ("A", "B", "C", "NA", "DNP", "CATCHUP"):
         return jsonify({"error": "Invalid response type"}), 400
     
-    # Add the call
-    call_id = database.add_call(name, response, selected_date)
-    
-    # Get updated stats
-    stats = database.get_today_stats(selected_date)
-    target = database.get_daily_target(selected_date) or 0
+    # Add the call and get updated stats in one transaction
+    call_id, stats, target = database.add_call(name, response, selected_date, return_stats=True)
     
     # Generate encouraging message
-    message = get_encouraging_message(response, stats["successful"], target)
+    message = get_encouraging_message(response, stats["successful"], target or 0)
     
-    return jsonify({
+    return jsonify(with_snapshot({
         "success": True,
         "call_id": call_id,
         "name": name,
         "stats": stats,
         "message": message
-    })
+    }, selected_date))
 
 
 @app.route("/stats")
 def get_stats():
     """Get statistics for a specific date."""
-    selected_date = request.args.get("date", database.get_today())
+    selected_date = request.args.get("date", g.today)
     stats = database.get_today_stats(selected_date)
     target = database.get_daily_target(selected_date)
     return jsonify({
@@ -139,22 +214,20 @@ def delete_call():
     """Delete a call record."""
     data = request.get_json()
     call_id = data.get("call_id")
-    selected_date = data.get("date", database.get_today())
+    selected_date = data.get("date", g.today)
     
     if not call_id:
         return jsonify({"error": "Call ID is required"}), 400
     
-    deleted = database.delete_call(call_id)
+    deleted, stats, target = database.delete_call(call_id, selected_date, return_stats=True)
     
     if deleted:
         # Return updated stats
-        stats = database.get_today_stats(selected_date)
-        target = database.get_daily_target(selected_date) or 0
-        return jsonify({
+        return jsonify(with_snapshot({
             "success": True,
             "stats": stats,
-            "target": target
-        })
+            "target": target or 0
+        }, selected_date))
     
     return jsonify({"error": "Call not found"}), 404
 
@@ -165,7 +238,7 @@ def update_call():
     data = request.get_json()
     call_id = data.get("call_id")
     response = data.get("response", "").upper()
-    selected_date = data.get("date", database.get_today())
+    selected_date = data.get("date", g.today)
     
     if not call_id:
         return jsonify({"error": "Call ID is required"}), 400
@@ -173,31 +246,53 @@ def update_call():
     if response not in ("A", "B", "C", "NA", "DNP", "CATCHUP"):
         return jsonify({"error": "Invalid response type"}), 400
     
-    updated = database.update_call(call_id, response)
+    updated, stats, target = database.update_call(call_id, response, selected_date, return_stats=True)
     
     if updated:
-        # Get updated stats
-        stats = database.get_today_stats(selected_date)
-        target = database.get_daily_target(selected_date) or 0
-        
         # Generate encouraging message
-        message = get_encouraging_message(response, stats["successful"], target)
+        message = get_encouraging_message(response, stats["successful"], target or 0)
         
-        return jsonify({
+        return jsonify(with_snapshot({
             "success": True,
             "stats": stats,
             "message": message
-        })
+        }, selected_date))
     
     return jsonify({"error": "Call not found"}), 404
 
 
+@app.route("/bootstrap")
+def bootstrap():
+    """Get stats, target, calls and contacts for a date in a single response."""
+    selected_date = request.args.get("date", g.today)
+    target, stats, calls, contacts = database.get_dashboard_snapshot(selected_date)
+    return jsonify({
+        "date": selected_date,
+        "today": g.today,
+        "stats": stats,
+        "target": target,
+        "calls": calls,
+        "contacts": contacts
+    })
+
+
 # Contact management routes
 @app.route("/contacts")
 def get_contacts():
-    """Get all contacts."""
-    contacts = database.get_all_contacts()
-    return jsonify({"contacts": contacts})
+    """Get a page of contacts; pass next_cursor back as ?cursor= for the next page."""
+    try:
+        limit, after = get_page_args()
+    except ValueError:
+        return jsonify({"error": "Invalid cursor"}), 400
+    
+    # Fetch one extra row to know whether another page exists
+    contacts = database.get_all_contacts(limit + 1, after)
+    next_cursor = None
+    if len(contacts) > limit:
+        contacts = contacts[:limit]
+        next_cursor = encode_cursor((contacts[-1].name, contacts[-1].date))
+    
+    return jsonify({"contacts": contacts, "next_cursor": next_cursor})
 
 
 @app.route("/add-contact", methods=["POST"])
@@ -205,7 +300,7 @@ def add_contact():
     """Add a new contact for a specific date."""
     data = request.get_json()
     name = data.get("name", "").strip()
-    selected_date = data.get("date", database.get_today())
+    selected_date = data.get("date", g.today)
     
     if not name:
         return jsonify({"error": "Name is required"}), 400
@@ -258,7 +353,7 @@ def delete_contact_permanent():
 
 @app.route("/summary")
 def summary():
-    """Render the summary page with all contacts and their latest responses."""
+    """Render the summary page with the first page of contacts and their latest responses."""
     # Get filter from query params (comma-separated)
     filter_param = request.args.get("filter", "")
     filters = [f.strip().upper() for f in filter_param.split(",") if f.strip()]
@@ -266,19 +361,42 @@ def summary():
     # Map 'NA' display to actual filter
     filters = ['NA' if f == 'N/A' else f for f in filters]
     
-    contacts = database.get_all_contacts_summary(filters if filters else None)
-    today = database.get_today()
+    try:
+        limit, after = get_page_args()
+    except ValueError:
+        return jsonify({"error": "Invalid cursor"}), 400
+    
+    # Fetch one extra row to know whether another page exists
+    contacts = database.get_all_contacts_summary(filters if filters else None, limit + 1, after)
+    next_cursor = None
+    if len(contacts) > limit:
+        contacts = contacts[:limit]
+        next_cursor = encode_cursor((contacts[-1].last_called_date, contacts[-1].name))
+    
+    # Later pages are lazy-loaded by the page as JSON
+    if request.accept_mimetypes.best == "application/json":
+        response = jsonify({"contacts": contacts, "next_cursor": next_cursor})
+        response.vary.add("Accept")
+        return response
+    
+    today = g.today
     
     # Get names that are already in today's list
-    added_to_today = database.get_contacts_added_today()
+    added_to_today = database.get_contacts_added_today(today)
+    total_count, not_added_count = database.get_contacts_summary_counts(filters, today)
     
-    return render_template(
+    response = app.make_response(render_template(
         "summary.html",
         contacts=contacts,
+        next_cursor=next_cursor,
+        total_count=total_count,
+        not_added_count=not_added_count,
         active_filters=filters,
         today=today,
         added_to_today=added_to_today
-    )
+    ))
+    response.vary.add("Accept")
+    return response
 
 
 @app.route("/add-to-today", methods=["POST"])
@@ -290,7 +408,7 @@ def add_to_today():
     if not name:
         return jsonify({"error": "Name is required"}), 400
     
-    today = database.get_today()
+    today = g.today
     
     try:
         # skip_global_check=True because these contacts already exist from previous dates
@@ -320,20 +438,11 @@ def add_multiple_to_today():
     if not names:
         return jsonify({"error": "Names are required"}), 400
     
-    today = database.get_today()
-    added = []
-    skipped = []
-    
-    for name in names:
-        name = name.strip()
-        if not name:
-            continue
-        try:
-            # skip_global_check=True because these contacts already exist from previous dates
-            database.add_contact(name, today, skip_global_check=True)
-            added.append(name)
-        except:
-            skipped.append(name)
+    today = g.today
+    names = [name.strip() for name in names if name.strip()]
+    
+    # Names already in today's list are skipped
+    added, skipped = database.add_contacts_bulk(names, today)
     
     return jsonify({
         "success": True,
@@ -352,13 +461,22 @@ def month_achievements():
     
     if not year or not month:
         # Default to current month
-        today = database.get_today()
+        today = g.today
         parts = today.split('-')
         year = int(parts[0])
         month = int(parts[1])
     
+    # Tag the response by its content so the calendar can revalidate with
+    # If-None-Match and skip re-downloading and re-rendering an unchanged month
     achievements = database.get_month_achievements(year, month)
-    return jsonify({"achievements": achievements})
+    etag = hashlib.sha1(repr((year, month, sorted(achievements.items()))).encode()).hexdigest()
+    if request.if_none_match.contains(etag):
+        return "", 304, {"ETag": f'"{etag}"', "Cache-Control": "private, must-revalidate"}
+    
+    response = jsonify({"achievements": achievements})
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = "private, must-revalidate"
+    return response
 
 
 if __name__ == "__main__":
@@ -1,56 +1,249 @@
+import queue
 import sqlite3
 import threading
-from datetime import date
-from typing import Optional
+import time
+from collections import namedtuple
+from concurrent.futures import Future
+from typing import Callable, Optional
 
 DATABASE_PATH = "calls.db"
 
-# Singleton connection manager
+# Row types returned by the list queries (connections return plain tuples)
+CallRow = namedtuple("CallRow", "id name response created_at")
+CallHistoryRow = namedtuple("CallHistoryRow", "id name response date created_at")
+ContactRow = namedtuple("ContactRow", "id name added_date has_call_today")
+ContactListRow = namedtuple("ContactListRow", "id name date")
+SummaryRow = namedtuple("SummaryRow", "name latest_response last_called_date dnp_count display_response")
+
+# Pooled connection manager
 class DatabaseConnection:
+    """
+    Bounded pool of long-lived connections so reads can run concurrently under WAL.
+    
+    A thread checks a connection out on first use and keeps it until
+    release_connection() hands it back (the Flask app does this at the end of
+    every request), so each connection is used by one thread at a time while
+    its page cache and prepared statements survive across requests.
+    The write queue thread (see WriteQueue) holds one connection for its lifetime.
+    """
     _instance = None
     _lock = threading.Lock()
-    _connection = None
+    pool_size = 8
     
     def __new__(cls):
         if cls._instance is None:
             with cls._lock:
                 if cls._instance is None:
                     cls._instance = super().__new__(cls)
+                    cls._instance._local = threading.local()
+                    # LIFO so the most recently used (warmest) connection is reused first
+                    cls._instance._idle = queue.LifoQueue()
+                    cls._instance._created = 0
         return cls._instance
     
+    def _connect(self):
+        """Open and configure a new connection."""
+        connection = sqlite3.connect(
+            DATABASE_PATH, 
+            timeout=30,
+            check_same_thread=False,  # Moves between threads, used by one at a time
+            cached_statements=256  # Keep every helper's query prepared
+        )
+        # Enable WAL mode for better concurrent access
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA busy_timeout=30000")
+        # Page cache tuning for the read-heavy workload; NORMAL sync is
+        # durable enough under WAL and saves an fsync per commit
+        connection.executescript("""
+            PRAGMA synchronous=NORMAL;
+            PRAGMA mmap_size=268435456;
+            PRAGMA cache_size=-65536;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA wal_autocheckpoint=1000;
+            PRAGMA cache_spill=OFF;
+        """)
+        return connection
+    
+    def _checkout(self):
+        """Take an idle connection, open a new one under the cap, or wait for one."""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        
+        with self._lock:
+            can_create = self._created < self.pool_size
+            if can_create:
+                self._created += 1
+        if can_create:
+            try:
+                return self._connect()
+            except Exception:
+                with self._lock:
+                    self._created -= 1
+                raise
+        
+        try:
+            return self._idle.get(timeout=30)
+        except queue.Empty:
+            raise sqlite3.OperationalError("Timed out waiting for a database connection")
+    
     def get_connection(self):
-        """Get or create the singleton database connection."""
-        if self._connection is None:
+        """Get the calling thread's database connection, checking one out if needed."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = self._checkout()
+            self._local.connection = connection
+        return connection
+    
+    def release(self):
+        """Return the calling thread's connection to the pool."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            return
+        self._local.connection = None
+        try:
+            if connection.in_transaction:
+                connection.rollback()
+        except sqlite3.Error:
+            # Don't hand a broken connection to the next thread
+            connection.close()
             with self._lock:
-                if self._connection is None:
-                    self._connection = sqlite3.connect(
-                        DATABASE_PATH, 
-                        timeout=30,
-                        check_same_thread=False  # Allow multi-threaded access
-                    )
-                    self._connection.row_factory = sqlite3.Row
-                    # Enable WAL mode for better concurrent access
-                    self._connection.execute("PRAGMA journal_mode=WAL")
-                    self._connection.execute("PRAGMA busy_timeout=30000")
-        return self._connection
+                self._created -= 1
+            return
+        self._idle.put(connection)
     
     def close(self):
-        """Close the connection if open."""
-        if self._connection:
-            with self._lock:
-                if self._connection:
-                    self._connection.close()
-                    self._connection = None
-
-# Global singleton instance
+        """Close the calling thread's connection and all idle connections."""
+        connections = []
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connections.append(connection)
+            self._local.connection = None
+        while True:
+            try:
+                connections.append(self._idle.get_nowait())
+            except queue.Empty:
+                break
+        for connection in connections:
+            connection.close()
+        with self._lock:
+            self._created -= len(connections)
+
+# Global instance
 _db_manager = DatabaseConnection()
 
 
 def get_connection():
-    """Get the singleton database connection."""
+    """Get the calling thread's pooled database connection."""
     return _db_manager.get_connection()
 
 
+def release_connection():
+    """Return the calling thread's connection to the pool (call at the end of a request)."""
+    _db_manager.release()
+
+
+# Group-commit write queue
+class WriteQueue:
+    """
+    Runs write jobs on a single background thread and commits them in batches.
+    
+    Each job is a callable taking a cursor. Jobs arriving within a short window
+    share one transaction (and one fsync); each runs under its own savepoint so
+    a failing job is rolled back without affecting the rest of the batch.
+    Reads stay on the caller's thread.
+    """
+    
+    def __init__(self, max_batch: int = 16, max_wait: float = 0.005, timeout: float = 60):
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        # Longer than busy_timeout, so it only fires if the writer is stuck
+        self.timeout = timeout
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread = None
+    
+    def submit(self, job: Callable):
+        """
+        Queue a write job and block until its batch is committed. Returns the job's result.
+        Raises concurrent.futures.TimeoutError if the batch doesn't finish within timeout.
+        """
+        self._ensure_started()
+        future = Future()
+        self._queue.put((job, future))
+        return future.result(timeout=self.timeout)
+    
+    def _ensure_started(self):
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name="db-writer", daemon=True)
+                    self._thread.start()
+    
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            # Never let an error kill the writer thread: later writes would hang
+            try:
+                self._run_batch(batch)
+            except Exception as e:
+                self._fail(batch, e)
+    
+    @staticmethod
+    def _fail(batch: list, error: Exception):
+        """Resolve every still-pending future in the batch with error."""
+        for job, future in batch:
+            if not future.done():
+                future.set_exception(error)
+    
+    def _run_batch(self, batch: list):
+        conn = None
+        outcomes = []
+        try:
+            conn = get_connection()
+            cursor = conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            for job, future in batch:
+                cursor.execute("SAVEPOINT job")
+                try:
+                    outcomes.append((future, job(cursor), None))
+                    cursor.execute("RELEASE job")
+                except Exception as e:
+                    cursor.execute("ROLLBACK TO job")
+                    cursor.execute("RELEASE job")
+                    outcomes.append((future, None, e))
+            conn.commit()
+        except Exception as e:
+            try:
+                if conn is not None and conn.in_transaction:
+                    conn.rollback()
+            except Exception:
+                pass  # The batch error below is the one worth reporting
+            # Nothing was committed, so every job in the batch fails
+            self._fail(batch, e)
+            return
+        
+        for future, result, error in outcomes:
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+
+# Global write queue instance
+_write_queue = WriteQueue()
+
+
 def init_db():
     """Initialize the database with required tables."""
     conn = get_connection()
@@ -117,100 +310,154 @@ def init_db():
         SELECT DISTINCT name FROM calls
     """)
     
+    # Latest call per contact, kept on all_contacts by the triggers below
+    # so the summary page can be served from an index without a sort
+    latest_call_columns = """
+        last_response = (
+            SELECT response FROM calls WHERE calls.name = all_contacts.name
+            ORDER BY date DESC, created_at DESC, id DESC LIMIT 1
+        ),
+        last_called_date = (
+            SELECT date FROM calls WHERE calls.name = all_contacts.name
+            ORDER BY date DESC, created_at DESC, id DESC LIMIT 1
+        )
+    """
+    
+    # Migration: Add last_response/last_called_date columns and backfill them
+    try:
+        cursor.execute("ALTER TABLE all_contacts ADD COLUMN last_response TEXT")
+        cursor.execute("ALTER TABLE all_contacts ADD COLUMN last_called_date TEXT")
+        cursor.execute(f"UPDATE all_contacts SET {latest_call_columns}")
+    except:
+        pass  # Columns already exist
+    
+    for trigger, event, names in (
+        ("trg_calls_insert_latest", "INSERT ON calls", ("NEW.name",)),
+        ("trg_calls_delete_latest", "DELETE ON calls", ("OLD.name",)),
+        ("trg_calls_update_latest", "UPDATE ON calls", ("OLD.name", "NEW.name")),
+        ("trg_all_contacts_insert_latest", "INSERT ON all_contacts", ("NEW.name",)),
+    ):
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS {trigger} AFTER {event}
+            BEGIN
+                UPDATE all_contacts SET {latest_call_columns}
+                WHERE name IN ({", ".join(names)});
+            END
+        """)
+    
+    # Migration: Add summary_key, a single ascending sort key for the summary
+    # page (most recently called first, never-called last) so keyset pages can
+    # seek with one (summary_key, name) row-value comparison
+    try:
+        cursor.execute("""
+            ALTER TABLE all_contacts ADD COLUMN summary_key REAL
+            GENERATED ALWAYS AS (COALESCE(-julianday(last_called_date), 0)) VIRTUAL
+        """)
+    except:
+        pass  # Column already exists
+    
+    cursor.execute("DROP INDEX IF EXISTS idx_all_contacts_last_called")
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_all_contacts_summary
+        ON all_contacts(summary_key, name)
+    """)
+    
+    # Indexes for the date/response stats queries and per-name lookups
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_calls_date_response ON calls(date, response)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_calls_name_date ON calls(name, date DESC, created_at DESC)")
+    
+    # Case-insensitive uniqueness per date ('Alice' and 'alice' collapse);
+    # its leading NOCASE column also serves contact_exists_anywhere
+    try:
+        cursor.execute("""
+            CREATE UNIQUE INDEX IF NOT EXISTS uniq_contacts_name_nocase_date
+            ON contacts(name COLLATE NOCASE, date)
+        """)
+        cursor.execute("DROP INDEX IF EXISTS idx_contacts_name_nocase")
+    except sqlite3.IntegrityError:
+        # Existing case-only duplicates; fall back to a plain NOCASE index
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_contacts_name_nocase ON contacts(name COLLATE NOCASE)")
+    
     conn.commit()
+    release_connection()
 
 
-def get_today() -> str:
-    """Get today's date as string."""
-    return date.today().isoformat()
-
-
-def get_daily_target(target_date: Optional[str] = None) -> Optional[int]:
-    """Get the daily target for a specific date (defaults to today)."""
-    if target_date is None:
-        target_date = get_today()
-    
+def get_daily_target(target_date: str) -> Optional[int]:
+    """Get the daily target for a specific date."""
     conn = get_connection()
     cursor = conn.cursor()
     cursor.execute("SELECT target FROM daily_targets WHERE date = ?", (target_date,))
     row = cursor.fetchone()
-    return row["target"] if row else None
+    return row[0] if row else None
 
 
-def set_daily_target(target: int, target_date: Optional[str] = None) -> None:
-    """Set or update the daily target for a specific date (defaults to today)."""
-    if target_date is None:
-        target_date = get_today()
+def set_daily_target(target: int, target_date: str, return_stats: bool = False):
+    """
+    Set or update the daily target for a specific date.
     
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("""
-        INSERT OR REPLACE INTO daily_targets (date, target) VALUES (?, ?)
-    """, (target_date, target))
-    conn.commit()
+    return_stats: If True, returns the stats for target_date,
+                  read in the same transaction as the write
+    """
+    def write(cursor):
+        cursor.execute("""
+            INSERT OR REPLACE INTO daily_targets (date, target) VALUES (?, ?)
+        """, (target_date, target))
+        
+        if return_stats:
+            stats, _ = _get_stats_and_target(cursor, target_date)
+            return stats
+    
+    return _write_queue.submit(write)
 
 
-def add_call(name: str, response: str, call_date: Optional[str] = None) -> int:
-    """Add a new call record. Returns the new call ID."""
-    if call_date is None:
-        call_date = get_today()
-    
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("""
-        INSERT INTO calls (name, response, date) VALUES (?, ?, ?)
-    """, (name, response, call_date))
-    call_id = cursor.lastrowid
+def add_call(name: str, response: str, call_date: str, return_stats: bool = False):
+    """
+    Add a new call record. Returns the new call ID.
     
-    # Update DNP count in all_contacts
-    if response == 'DNP':
-        # Increment DNP count
-        cursor.execute("""
-            UPDATE all_contacts SET dnp_count = dnp_count + 1 WHERE name = ?
-        """, (name,))
-    else:
-        # Reset DNP count to 0 when response is not DNP
+    return_stats: If True, returns (call_id, stats, target) for call_date,
+                  read in the same transaction as the insert
+    """
+    def write(cursor):
         cursor.execute("""
-            UPDATE all_contacts SET dnp_count = 0 WHERE name = ?
-        """, (name,))
+            INSERT INTO calls (name, response, date) VALUES (?, ?, ?)
+        """, (name, response, call_date))
+        call_id = cursor.lastrowid
+        
+        # Update DNP count in all_contacts
+        if response == 'DNP':
+            # Increment DNP count
+            cursor.execute("""
+                UPDATE all_contacts SET dnp_count = dnp_count + 1 WHERE name = ?
+            """, (name,))
+        else:
+            # Reset DNP count to 0 when response is not DNP
+            cursor.execute("""
+                UPDATE all_contacts SET dnp_count = 0 WHERE name = ?
+            """, (name,))
+        
+        if return_stats:
+            stats, target = _get_stats_and_target(cursor, call_date)
+            return call_id, stats, target
+        return call_id
     
-    conn.commit()
-    return call_id
+    return _write_queue.submit(write)
 
 
-def get_today_calls(call_date: Optional[str] = None) -> list:
-    """Get all calls for a specific date (defaults to today)."""
-    if call_date is None:
-        call_date = get_today()
-    
-    conn = get_connection()
-    cursor = conn.cursor()
+def get_today_calls(call_date: str, cursor=None) -> list:
+    """Get all calls for a specific date."""
+    if cursor is None:
+        cursor = get_connection().cursor()
     cursor.execute("""
         SELECT id, name, response, created_at 
         FROM calls 
         WHERE date = ? 
         ORDER BY created_at DESC
     """, (call_date,))
-    rows = cursor.fetchall()
-    return [dict(row) for row in rows]
+    return list(map(CallRow._make, cursor.fetchall()))
 
 
-def get_today_stats(call_date: Optional[str] = None) -> dict:
-    """Get statistics for a specific date (defaults to today)."""
-    if call_date is None:
-        call_date = get_today()
-    
-    conn = get_connection()
-    cursor = conn.cursor()
-    
-    # Get counts by response type
-    cursor.execute("""
-        SELECT response, COUNT(*) as count 
-        FROM calls 
-        WHERE date = ? 
-        GROUP BY response
-    """, (call_date,))
-    
+def _build_stats(rows) -> dict:
+    """Build the stats dict from (response, count) rows."""
     stats = {
         "A": 0,
         "B": 0,
@@ -222,9 +469,7 @@ def get_today_stats(call_date: Optional[str] = None) -> dict:
         "successful": 0  # A + B + C
     }
     
-    for row in cursor.fetchall():
-        response = row["response"]
-        count = row["count"]
+    for response, count in rows:
         if response in stats:
             stats[response] = count
         stats["total"] += count
@@ -234,48 +479,133 @@ def get_today_stats(call_date: Optional[str] = None) -> dict:
     return stats
 
 
+def _get_stats_and_target(cursor, stats_date: str) -> tuple:
+    """
+    Get (stats, target) for a date with a single query.
+    Meant to run on the cursor of an open write transaction.
+    """
+    cursor.execute("""
+        SELECT response, COUNT(*) FROM calls WHERE date = ? GROUP BY response
+        UNION ALL
+        SELECT 'TARGET', target FROM daily_targets WHERE date = ?
+    """, (stats_date, stats_date))
+    
+    target = None
+    counts = []
+    for response, value in cursor.fetchall():
+        if response == 'TARGET':
+            target = value
+        else:
+            counts.append((response, value))
+    
+    return _build_stats(counts), target
+
+
+def get_today_stats(call_date: str) -> dict:
+    """Get statistics for a specific date."""
+    conn = get_connection()
+    cursor = conn.cursor()
+    
+    # Get counts by response type
+    cursor.execute("""
+        SELECT response, COUNT(*) as count 
+        FROM calls 
+        WHERE date = ? 
+        GROUP BY response
+    """, (call_date,))
+    
+    return _build_stats(cursor.fetchall())
+
+
 def contact_exists_anywhere(name: str) -> bool:
     """Check if a contact with this name exists anywhere in the database."""
     conn = get_connection()
     cursor = conn.cursor()
-    cursor.execute("SELECT 1 FROM contacts WHERE LOWER(name) = LOWER(?)", (name,))
+    cursor.execute("SELECT 1 FROM contacts WHERE name = ? COLLATE NOCASE", (name,))
     return cursor.fetchone() is not None
 
 
 # Contact management functions
-def add_contact(name: str, contact_date: Optional[str] = None, skip_global_check: bool = False) -> int:
+def add_contact(name: str, contact_date: str, skip_global_check: bool = False) -> int:
     """
     Add a new contact for a specific date. Returns the contact ID.
     
     skip_global_check: If True, only checks if contact exists for the specific date
                        (used when adding from summary page to today's list)
     """
-    if contact_date is None:
-        contact_date = get_today()
-    
-    # Check if name already exists for this date
-    if contact_exists_for_date(name, contact_date):
-        raise ValueError(f"Contact '{name}' already in today's list")
+    def write(cursor):
+        # Check if name already exists anywhere (unless skipped), using the NOCASE index;
+        # the same lookup tells whether the match is this date's entry
+        if not skip_global_check:
+            cursor.execute(
+                "SELECT MAX(name = ? AND date = ?) FROM contacts WHERE name = ? COLLATE NOCASE",
+                (name, contact_date, name)
+            )
+            same_date = cursor.fetchone()[0]
+            if same_date == 1:
+                raise ValueError(f"Contact '{name}' already in today's list")
+            if same_date is not None:
+                raise ValueError(f"Contact '{name}' already exists")
+        
+        # Insert into contacts table for the specific date;
+        # UNIQUE(name, date) rejects names already in this date's list
+        try:
+            cursor.execute("INSERT INTO contacts (name, date) VALUES (?, ?)", (name, contact_date))
+        except sqlite3.IntegrityError:
+            raise ValueError(f"Contact '{name}' already in today's list")
+        contact_id = cursor.lastrowid
+        
+        # Also insert into all_contacts (permanent record) - ignore if already exists
+        cursor.execute("INSERT OR IGNORE INTO all_contacts (name) VALUES (?)", (name,))
+        return contact_id
     
-    # Check if name already exists anywhere (unless skipped)
-    if not skip_global_check and contact_exists_anywhere(name):
-        raise ValueError(f"Contact '{name}' already exists")
+    return _write_queue.submit(write)
+
+
+def add_contacts_bulk(names: list, contact_date: str) -> tuple:
+    """
+    Add multiple contacts for a specific date in a single transaction.
+    Names already in the list for that date are skipped.
     
-    conn = get_connection()
-    cursor = conn.cursor()
+    Returns (added, skipped) lists of names, in input order.
+    """
+    unique_names = list(dict.fromkeys(names))
+    
+    def write(cursor):
+        inserted = set()
+        # Chunk to stay well under SQLite's bound parameter limit
+        for i in range(0, len(unique_names), 500):
+            chunk = unique_names[i:i + 500]
+            placeholders = ", ".join("(?, ?)" for _ in chunk)
+            params = [value for name in chunk for value in (name, contact_date)]
+            cursor.execute(
+                f"INSERT OR IGNORE INTO contacts (name, date) VALUES {placeholders} RETURNING name",
+                params
+            )
+            inserted.update(row[0] for row in cursor.fetchall())
+        
+        # Also insert into all_contacts (permanent record) - ignore if already exists
+        cursor.executemany(
+            "INSERT OR IGNORE INTO all_contacts (name) VALUES (?)",
+            [(name,) for name in inserted]
+        )
+        return inserted
     
-    # Insert into contacts table for the specific date
-    cursor.execute("INSERT INTO contacts (name, date) VALUES (?, ?)", (name, contact_date))
-    contact_id = cursor.lastrowid
+    inserted = _write_queue.submit(write)
     
-    # Also insert into all_contacts (permanent record) - ignore if already exists
-    cursor.execute("INSERT OR IGNORE INTO all_contacts (name) VALUES (?)", (name,))
+    added = []
+    skipped = []
+    for name in names:
+        if name in inserted:
+            added.append(name)
+            inserted.discard(name)
+        else:
+            skipped.append(name)
     
-    conn.commit()
-    return contact_id
+    return added, skipped
 
 
-def get_contacts_for_date(target_date: Optional[str] = None) -> list:
+def get_contacts_for_date(target_date: str, cursor=None) -> list:
     """
     Get contacts to show for a specific date.
     Shows:
@@ -287,34 +617,29 @@ def get_contacts_for_date(target_date: Optional[str] = None) -> list:
     Ordered by: attempted calls first, then non-attempted
     Returns only unique names (prefers today's entry if exists).
     """
-    if target_date is None:
-        target_date = get_today()
-    
-    conn = get_connection()
-    cursor = conn.cursor()
+    if cursor is None:
+        cursor = get_connection().cursor()
     
     # Get all relevant contacts with a flag for whether they have a call today
     # Use GROUP BY name to ensure unique names, preferring entries from target_date
+    # Each subquery is a seek on idx_calls_name_date, so the cost tracks the
+    # number of contacts rather than the size of the calls table
     cursor.execute("""
         SELECT 
-            MAX(CASE WHEN c.date = ? THEN c.id ELSE c.id END) as id,
+            MAX(c.id) as id,
             c.name, 
             MAX(c.date) as added_date,
-            CASE WHEN EXISTS (
-                SELECT 1 FROM calls WHERE calls.name = c.name AND calls.date = ?
-            ) THEN 1 ELSE 0 END as has_call_today
+            EXISTS (SELECT 1 FROM calls WHERE calls.name = c.name AND calls.date = :d) as has_call_today
         FROM contacts c
         WHERE 
             -- Contacts added on target_date (always show)
-            c.date = ?
+            c.date = :d
             
             -- Previous contacts that need to carry forward (uncalled)
-            OR (c.date < ? AND NOT EXISTS (
-                SELECT 1 FROM calls WHERE calls.name = c.name
-            ))
+            OR (c.date < :d AND NOT EXISTS (SELECT 1 FROM calls WHERE calls.name = c.name))
             
             -- Previous contacts whose last response was DNP
-            OR (c.date < ? AND (
+            OR (c.date < :d AND (
                 SELECT response FROM calls 
                 WHERE calls.name = c.name 
                 ORDER BY date DESC, created_at DESC 
@@ -322,60 +647,85 @@ def get_contacts_for_date(target_date: Optional[str] = None) -> list:
             ) = 'DNP')
             
             -- Previous contacts that have a call logged on target_date
-            OR (c.date < ? AND EXISTS (
-                SELECT 1 FROM calls WHERE calls.name = c.name AND calls.date = ?
-            ))
+            OR (c.date < :d AND EXISTS (SELECT 1 FROM calls WHERE calls.name = c.name AND calls.date = :d))
         
         GROUP BY c.name
         ORDER BY has_call_today DESC, MIN(c.created_at) ASC
-    """, (target_date, target_date, target_date, target_date, target_date, target_date, target_date))
+    """, {"d": target_date})
     
-    rows = cursor.fetchall()
-    return [dict(row) for row in rows]
+    return list(map(ContactRow._make, cursor.fetchall()))
 
 
-def get_all_contacts() -> list:
-    """Get all contacts (for backwards compatibility)."""
+def get_dashboard_snapshot(selected_date: str) -> tuple:
+    """
+    Get everything the dashboard shows for a date in one go.
+    Returns (target, stats, calls, contacts), read in one transaction so
+    all four see the same WAL snapshot.
+    """
     conn = get_connection()
     cursor = conn.cursor()
-    cursor.execute("SELECT id, name FROM contacts ORDER BY name ASC")
-    rows = cursor.fetchall()
-    return [dict(row) for row in rows]
+    cursor.execute("BEGIN DEFERRED")
+    try:
+        stats, target = _get_stats_and_target(cursor, selected_date)
+        calls = get_today_calls(selected_date, cursor)
+        contacts = get_contacts_for_date(selected_date, cursor)
+    finally:
+        conn.commit()
+    return target, stats, calls, contacts
 
 
-def delete_contact(contact_id: int) -> bool:
-    """Delete a contact by ID (from today's list only)."""
+def get_all_contacts(limit: Optional[int] = None, after: Optional[tuple] = None) -> list:
+    """
+    Get all contacts (for backwards compatibility), ordered by name then date.
+    
+    limit: maximum number of rows to return (None means all)
+    after: (name, date) of the last row already seen, for keyset pagination
+    """
     conn = get_connection()
     cursor = conn.cursor()
-    cursor.execute("DELETE FROM contacts WHERE id = ?", (contact_id,))
-    deleted = cursor.rowcount > 0
-    conn.commit()
-    return deleted
+    
+    where_clause = ""
+    params = []
+    if after is not None:
+        where_clause = "WHERE (name, date) > (?, ?)"
+        params.extend(after)
+    
+    cursor.execute(f"""
+        SELECT id, name, date FROM contacts
+        {where_clause}
+        ORDER BY name ASC, date ASC
+        LIMIT ?
+    """, params + [-1 if limit is None else limit])
+    return list(map(ContactListRow._make, cursor.fetchall()))
+
+
+def delete_contact(contact_id: int) -> bool:
+    """Delete a contact by ID (from today's list only)."""
+    def write(cursor):
+        cursor.execute("DELETE FROM contacts WHERE id = ?", (contact_id,))
+        return cursor.rowcount > 0
+    
+    return _write_queue.submit(write)
 
 
 def delete_contact_permanent(name: str) -> bool:
     """Permanently delete a contact by name from all tables."""
-    conn = get_connection()
-    cursor = conn.cursor()
-    
-    # Delete from all_contacts (permanent record)
-    cursor.execute("DELETE FROM all_contacts WHERE name = ?", (name,))
-    
-    # Delete from contacts (daily list)
-    cursor.execute("DELETE FROM contacts WHERE name = ?", (name,))
-    
-    # Delete from calls (call history)
-    cursor.execute("DELETE FROM calls WHERE name = ?", (name,))
+    def write(cursor):
+        # Delete from all_contacts (permanent record)
+        cursor.execute("DELETE FROM all_contacts WHERE name = ?", (name,))
+        
+        # Delete from contacts (daily list)
+        cursor.execute("DELETE FROM contacts WHERE name = ?", (name,))
+        
+        # Delete from calls (call history)
+        cursor.execute("DELETE FROM calls WHERE name = ?", (name,))
     
-    conn.commit()
+    _write_queue.submit(write)
     return True
 
 
-def contact_exists_for_date(name: str, target_date: Optional[str] = None) -> bool:
+def contact_exists_for_date(name: str, target_date: str) -> bool:
     """Check if a contact with this name exists for the given date."""
-    if target_date is None:
-        target_date = get_today()
-    
     conn = get_connection()
     cursor = conn.cursor()
     cursor.execute(
@@ -385,13 +735,22 @@ def contact_exists_for_date(name: str, target_date: Optional[str] = None) -> boo
     return cursor.fetchone() is not None
 
 
-def get_contacts_added_today() -> set:
+def get_contacts_added_today(today: str) -> frozenset:
     """Get set of contact names that are in today's list."""
-    today = get_today()
     conn = get_connection()
     cursor = conn.cursor()
     cursor.execute("SELECT name FROM contacts WHERE date = ?", (today,))
-    return {row['name'] for row in cursor.fetchall()}
+    return frozenset(name for name, in cursor.fetchall())
+
+
+def _month_bounds(year: int, month: int) -> tuple:
+    """Get the [start, end) date strings for a month."""
+    start_date = f"{year:04d}-{month:02d}-01"
+    if month == 12:
+        end_date = f"{year+1:04d}-01-01"
+    else:
+        end_date = f"{year:04d}-{month+1:02d}-01"
+    return start_date, end_date
 
 
 def get_month_achievements(year: int, month: int) -> dict:
@@ -404,18 +763,14 @@ def get_month_achievements(year: int, month: int) -> dict:
     cursor = conn.cursor()
     
     # Get all targets and successful call counts for the month
-    start_date = f"{year:04d}-{month:02d}-01"
-    if month == 12:
-        end_date = f"{year+1:04d}-01-01"
-    else:
-        end_date = f"{year:04d}-{month+1:02d}-01"
+    start_date, end_date = _month_bounds(year, month)
     
     # Get targets for the month
     cursor.execute("""
         SELECT date, target FROM daily_targets
         WHERE date >= ? AND date < ?
     """, (start_date, end_date))
-    targets = {row['date']: row['target'] for row in cursor.fetchall()}
+    targets = dict(cursor.fetchall())
     
     # Get successful call counts for the month
     cursor.execute("""
@@ -424,7 +779,7 @@ def get_month_achievements(year: int, month: int) -> dict:
         WHERE date >= ? AND date < ? AND response IN ('A', 'B', 'C')
         GROUP BY date
     """, (start_date, end_date))
-    successful_counts = {row['date']: row['successful'] for row in cursor.fetchall()}
+    successful_counts = dict(cursor.fetchall())
     
     # Determine achievements
     achievements = {}
@@ -435,100 +790,135 @@ def get_month_achievements(year: int, month: int) -> dict:
     return achievements
 
 
-def delete_call(call_id: int) -> bool:
-    """Delete a call by ID."""
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("DELETE FROM calls WHERE id = ?", (call_id,))
-    deleted = cursor.rowcount > 0
-    conn.commit()
-    return deleted
-
-
-def update_call(call_id: int, response: str) -> bool:
-    """Update the response of an existing call."""
-    conn = get_connection()
-    cursor = conn.cursor()
-    
-    # Get the contact name and old response before updating
-    cursor.execute("SELECT name, response FROM calls WHERE id = ?", (call_id,))
-    row = cursor.fetchone()
-    if not row:
-        return False
+def delete_call(call_id: int, stats_date: str, return_stats: bool = False):
+    """
+    Delete a call by ID.
     
-    name = row['name']
-    old_response = row['response']
+    return_stats: If True, returns (deleted, stats, target) for stats_date,
+                  read in the same transaction as the delete
+    """
+    def write(cursor):
+        cursor.execute("DELETE FROM calls WHERE id = ?", (call_id,))
+        deleted = cursor.rowcount > 0
+        
+        if return_stats:
+            stats, target = _get_stats_and_target(cursor, stats_date)
+            return deleted, stats, target
+        return deleted
     
-    # Update the call response
-    cursor.execute("UPDATE calls SET response = ? WHERE id = ?", (response, call_id))
-    updated = cursor.rowcount > 0
+    return _write_queue.submit(write)
+
+
+def update_call(call_id: int, response: str, stats_date: str, return_stats: bool = False):
+    """
+    Update the response of an existing call.
     
-    if updated:
-        # Update DNP count based on the change
-        if old_response == 'DNP' and response != 'DNP':
-            # Changed from DNP to something else - reset DNP count to 0
-            cursor.execute("UPDATE all_contacts SET dnp_count = 0 WHERE name = ?", (name,))
-        elif old_response != 'DNP' and response == 'DNP':
-            # Changed from non-DNP to DNP - increment DNP count
-            cursor.execute("UPDATE all_contacts SET dnp_count = dnp_count + 1 WHERE name = ?", (name,))
+    return_stats: If True, returns (updated, stats, target) for stats_date,
+                  read in the same transaction as the update
+    """
+    def write(cursor):
+        # Get the contact name and old response before updating
+        cursor.execute("SELECT name, response FROM calls WHERE id = ?", (call_id,))
+        row = cursor.fetchone()
+        if not row:
+            return (False, None, None) if return_stats else False
+        
+        name, old_response = row
+        
+        # Update the call response
+        cursor.execute("UPDATE calls SET response = ? WHERE id = ?", (response, call_id))
+        updated = cursor.rowcount > 0
+        
+        if updated:
+            # Update DNP count based on the change
+            if old_response == 'DNP' and response != 'DNP':
+                # Changed from DNP to something else - reset DNP count to 0
+                cursor.execute("UPDATE all_contacts SET dnp_count = 0 WHERE name = ?", (name,))
+            elif old_response != 'DNP' and response == 'DNP':
+                # Changed from non-DNP to DNP - increment DNP count
+                cursor.execute("UPDATE all_contacts SET dnp_count = dnp_count + 1 WHERE name = ?", (name,))
+        
+        if return_stats:
+            stats, target = _get_stats_and_target(cursor, stats_date)
+            return updated, stats, target
+        return updated
     
-    conn.commit()
-    return updated
+    return _write_queue.submit(write)
+
+
+def _summary_filter(filters: list = None) -> tuple:
+    """Build the SQL conditions and params for summary response filters."""
+    # Filter in SQL on the display response ('UN' for un-attempted)
+    if not filters:
+        return [], []
+    placeholders = ", ".join("?" for _ in filters)
+    return [f"COALESCE(last_response, 'UN') IN ({placeholders})"], list(filters)
 
 
-def get_all_contacts_summary(filters: list = None) -> list:
+def get_all_contacts_summary(filters: list = None, limit: Optional[int] = None,
+                             after: Optional[tuple] = None) -> list:
     """
     Get summary of all contacts with their latest response.
     Uses all_contacts table which permanently stores all names ever added.
     
     filters: list of response types to include (e.g., ['A', 'B', 'DNP', 'UN'])
-             'UN' means un-attempted contacts
+             'UN' means un-attempted contacts and may be passed explicitly
              None or empty means all
+    limit: maximum number of rows to return (None means all)
+    after: (last_called_date, name) of the last row already seen, for keyset pagination
     """
     conn = get_connection()
     cursor = conn.cursor()
     
-    # Get all contacts from the permanent all_contacts table
-    # with their latest call info and DNP count (stored in all_contacts)
-    cursor.execute("""
-        SELECT 
-            ac.name,
-            latest.response as latest_response,
-            latest.date as last_called_date,
-            COALESCE(ac.dnp_count, 0) as dnp_count
-        FROM all_contacts ac
-        LEFT JOIN (
-            -- Get the latest call for each contact
-            SELECT 
-                name,
-                response,
-                date,
-                ROW_NUMBER() OVER (PARTITION BY name ORDER BY date DESC, created_at DESC) as rn
-            FROM calls
-        ) latest ON ac.name = latest.name AND latest.rn = 1
-        ORDER BY 
-            CASE WHEN latest.response IS NULL THEN 1 ELSE 0 END,
-            latest.date DESC,
-            ac.name ASC
-    """)
+    conditions, params = _summary_filter(filters)
     
-    rows = cursor.fetchall()
+    # Keyset condition on (summary_key, name); the key is rebuilt from the
+    # cursor's date with the same expression as the column so it compares equal
+    if after is not None:
+        conditions.append("(summary_key, name) > (COALESCE(-julianday(?), 0), ?)")
+        params.extend(after)
     
-    results = []
-    for row in rows:
-        item = dict(row)
-        # Determine the display response
-        if item['latest_response'] is None:
-            item['display_response'] = 'UN'  # Un-attempted
-        else:
-            item['display_response'] = item['latest_response']
-        results.append(item)
+    where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
     
-    # Apply filters if specified
-    if filters and len(filters) > 0:
-        results = [r for r in results if r['display_response'] in filters]
+    # Get all contacts from the permanent all_contacts table with their latest
+    # call info and DNP count (both stored in all_contacts); the ORDER BY
+    # matches idx_all_contacts_summary so no sort is needed
+    cursor.execute(f"""
+        SELECT 
+            name,
+            last_response as latest_response,
+            last_called_date,
+            COALESCE(dnp_count, 0) as dnp_count,
+            COALESCE(last_response, 'UN') as display_response
+        FROM all_contacts
+        {where_clause}
+        ORDER BY summary_key, name
+        LIMIT ?
+    """, params + [-1 if limit is None else limit])
     
-    return results
+    return list(map(SummaryRow._make, cursor.fetchall()))
+
+
+def get_contacts_summary_counts(filters: list, today: str) -> tuple:
+    """
+    Count contacts matching the summary filters.
+    Returns (total, not_added) where not_added excludes names already in today's list.
+    """
+    conn = get_connection()
+    cursor = conn.cursor()
+    
+    conditions, params = _summary_filter(filters)
+    where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    
+    cursor.execute(f"""
+        SELECT 
+            COUNT(*),
+            COUNT(*) - COUNT(today.name)
+        FROM all_contacts
+        LEFT JOIN contacts today ON today.name = all_contacts.name AND today.date = ?
+        {where_clause}
+    """, [today] + params)
+    return tuple(cursor.fetchone())
 
 
 def get_contact_call_history(contact_name: str) -> list:
@@ -541,5 +931,4 @@ def get_contact_call_history(contact_name: str) -> list:
         WHERE name = ?
         ORDER BY date DESC, created_at DESC
     """, (contact_name,))
-    rows = cursor.fetchall()
-    return [dict(row) for row in rows]
+    return list(map(CallHistoryRow._make, cursor.fetchall()))